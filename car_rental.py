@@ -7,13 +7,29 @@ This module handles the core car rental operations.
 
 import csv
 import json
+import logging
+import sys
+from collections import defaultdict
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Dict, Iterable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
 
 
 class Car:
     """Represents a rental car."""
 
+    __slots__ = (
+        "car_id",
+        "make",
+        "model",
+        "year",
+        "daily_rate_cents",
+        "_whole_rate",
+        "available",
+    )
+
     def __init__(
         self,
         car_id: str,
@@ -30,6 +46,32 @@ class Car:
         self.daily_rate = daily_rate
         self.available = available
 
+    @property
+    def daily_rate(self) -> float:
+        """Daily rate in dollars; stored internally as integer cents."""
+        if self._whole_rate and self.daily_rate_cents % 100 == 0:
+            return self.daily_rate_cents // 100
+        return self.daily_rate_cents / 100
+
+    @daily_rate.setter
+    def daily_rate(self, value: float) -> None:
+        # Remember integer rates so they read back and print as integers.
+        self._whole_rate = type(value) is int
+        if self._whole_rate:
+            self.daily_rate_cents = value * 100
+            return
+
+        # Whole-cent floats like 45.0 scale exactly; anything else is rounded
+        # on the decimal value as written (0.285 -> 29 cents), not its binary
+        # float approximation.
+        cents = value * 100
+        if type(cents) is float and cents.is_integer():
+            self.daily_rate_cents = int(cents)
+        else:
+            self.daily_rate_cents = int(
+                Decimal(str(value)).scaleb(2).quantize(Decimal(1), ROUND_HALF_UP)
+            )
+
     def __str__(self):
         status = "Available" if self.available else "Rented"
         return f"{self.year} {self.make} {self.model} (ID: {self.car_id}) - ${self.daily_rate}/day - {status}"
@@ -38,6 +80,8 @@ class Car:
 class Customer:
     """Represents a rental customer."""
 
+    __slots__ = ("customer_id", "name", "email", "phone")
+
     def __init__(self, customer_id: str, name: str, email: str, phone: str):
         self.customer_id = customer_id
         self.name = name
@@ -51,6 +95,17 @@ class Customer:
 class Rental:
     """Represents a car rental transaction."""
 
+    __slots__ = (
+        "rental_id",
+        "customer",
+        "car",
+        "start_date",
+        "days",
+        "_end_date",
+        "total_cost_cents",
+        "returned",
+    )
+
     def __init__(
         self,
         rental_id: str,
@@ -64,10 +119,26 @@ class Rental:
         self.car = car
         self.start_date = start_date
         self.days = days
-        self.end_date = start_date + timedelta(days=days)
-        self.total_cost = car.daily_rate * days
+        self._end_date: Optional[datetime] = None
+        self.total_cost_cents = car.daily_rate_cents * days
         self.returned = False
 
+    @property
+    def end_date(self) -> datetime:
+        """End of the rental, computed on first access."""
+        if self._end_date is None:
+            self._end_date = self.start_date + timedelta(days=self.days)
+        return self._end_date
+
+    @end_date.setter
+    def end_date(self, value: datetime) -> None:
+        self._end_date = value
+
+    @property
+    def total_cost(self) -> float:
+        """Total cost in dollars."""
+        return self.total_cost_cents / 100
+
     def __str__(self):
         return (
             f"Rental {self.rental_id}: {self.customer.name} renting "
@@ -79,91 +150,185 @@ class Rental:
 class CarRentalSystem:
     """Main car rental management system."""
 
-    def __init__(self):
+    def __init__(self, verbose: bool = True):
+        self.verbose = verbose
         self.cars: List[Car] = []
         self.customers: List[Customer] = []
         self.rentals: List[Rental] = []
+        self._cars_by_id: Dict[str, Car] = {}
+        self._customers_by_id: Dict[str, Customer] = {}
+        self._available: Dict[str, Car] = {}
+        self._fleet_pos: Dict[str, int] = {}
+        self._available_unordered = False
+        self._by_make: Dict[str, Set[str]] = defaultdict(set)
+        self._by_model: Dict[str, Set[str]] = defaultdict(set)
+        self._rentals_by_id: Dict[str, Rental] = {}
+        self._active_rentals: Dict[str, Rental] = {}
+        self._completed_count = 0
+        self._total_revenue_cents = 0
+        self._next_rental_id = 0
+
+    def _log(self, msg: str, *args) -> None:
+        """Log a rental event unless the system was created quiet."""
+        if self.verbose:
+            logger.info(msg, *args)
 
     def add_car(self, car: Car) -> None:
         """Add a car to the fleet."""
-        self.cars.append(car)
+        self.add_cars((car,))
+
+    def add_cars(self, cars: Iterable[Car]) -> None:
+        """Add several cars to the fleet; raises ValueError on duplicate IDs."""
+        cars = list(cars)
+        self._check_new_ids(self._cars_by_id, [car.car_id for car in cars], "Car")
+        for car in cars:
+            self._by_make[car.make].add(car.car_id)
+            self._by_model[car.model].add(car.car_id)
+
+        start = len(self.cars)
+        self._fleet_pos.update({car.car_id: pos for pos, car in enumerate(cars, start)})
+        self.cars.extend(cars)
+        self._cars_by_id.update({car.car_id: car for car in cars})
+        self._available.update({car.car_id: car for car in cars if car.available})
 
     def add_customer(self, customer: Customer) -> None:
         """Add a customer to the system."""
-        self.customers.append(customer)
+        self.add_customers((customer,))
+
+    def add_customers(self, customers: Iterable[Customer]) -> None:
+        """Add several customers; raises ValueError on duplicate IDs."""
+        customers = list(customers)
+        self._check_new_ids(
+            self._customers_by_id, [c.customer_id for c in customers], "Customer"
+        )
+
+        self.customers.extend(customers)
+        self._customers_by_id.update({c.customer_id: c for c in customers})
+
+    @staticmethod
+    def _check_new_ids(index: Dict, new_ids: List[str], kind: str) -> None:
+        """Reject IDs that are already indexed or repeated in the batch."""
+        seen = set()
+        for new_id in new_ids:
+            if new_id in index or new_id in seen:
+                raise ValueError(f"{kind} {new_id} already exists")
+            seen.add(new_id)
 
     def get_available_cars(self) -> List[Car]:
-        """Get list of available cars."""
-        return [car for car in self.cars if car.available]
+        """Get list of available cars, in fleet order."""
+        if self._available_unordered:
+            # Returned cars were appended at the end; restore fleet order once.
+            pos = self._fleet_pos
+            self._available = dict(
+                sorted(self._available.items(), key=lambda item: pos[item[0]])
+            )
+            self._available_unordered = False
+        return list(self._available.values())
+
+    def get_active_rentals(self) -> List[Rental]:
+        """Get list of rentals that have not been returned."""
+        return list(self._active_rentals.values())
+
+    def find_available(
+        self, make: Optional[str] = None, model: Optional[str] = None
+    ) -> List[Car]:
+        """Get available cars matching make and/or model, in fleet order."""
+        if make is None and model is None:
+            return self.get_available_cars()
+
+        if make is None:
+            car_ids = self._by_model.get(model, set())
+        elif model is None:
+            car_ids = self._by_make.get(make, set())
+        else:
+            car_ids = self._by_make.get(make, set()) & self._by_model.get(model, set())
+
+        matches = sorted(
+            self._available.keys() & car_ids, key=self._fleet_pos.__getitem__
+        )
+        return [self._available[car_id] for car_id in matches]
+
+    def _set_available(self, car: Car, available: bool) -> None:
+        """Flip a car's availability and keep the available index in sync."""
+        car.available = available
+        if available:
+            self._available[car.car_id] = car
+            self._available_unordered = True
+        else:
+            self._available.pop(car.car_id, None)
 
     def find_car(self, car_id: str) -> Optional[Car]:
         """Find a car by ID."""
-        for car in self.cars:
-            if car.car_id == car_id:
-                return car
-        return None
+        return self._cars_by_id.get(car_id)
 
     def find_customer(self, customer_id: str) -> Optional[Customer]:
         """Find a customer by ID."""
-        for customer in self.customers:
-            if customer.customer_id == customer_id:
-                return customer
-        return None
+        return self._customers_by_id.get(customer_id)
 
-    def rent_car(self, customer_id: str, car_id: str, days: int) -> Optional[Rental]:
-        """Process a car rental."""
+    def rent_car(
+        self,
+        customer_id: str,
+        car_id: str,
+        days: int,
+        start_date: Optional[datetime] = None,
+    ) -> Optional[Rental]:
+        """Process a car rental, starting now unless start_date is given."""
         customer = self.find_customer(customer_id)
-        car = self.find_car(car_id)
-
         if not customer:
-            print(f"Customer {customer_id} not found")
+            self._log("Customer %s not found", customer_id)
             return None
 
+        car = self.find_car(car_id)
         if not car:
-            print(f"Car {car_id} not found")
+            self._log("Car %s not found", car_id)
             return None
 
         if not car.available:
-            print(f"Car {car_id} is not available")
+            self._log("Car %s is not available", car_id)
             return None
 
         # Create rental
-        rental_id = f"R{len(self.rentals) + 1:04d}"
-        rental = Rental(rental_id, customer, car, datetime.now(), days)
+        self._next_rental_id += 1
+        rental_id = "R%04d" % self._next_rental_id
+        if start_date is None:
+            start_date = datetime.now()
+        rental = Rental(rental_id, customer, car, start_date, days)
 
         # Mark car as unavailable
-        car.available = False
+        self._set_available(car, False)
 
         # Add to rentals
         self.rentals.append(rental)
+        self._rentals_by_id[rental_id] = rental
+        self._active_rentals[rental_id] = rental
 
-        print(f"Rental created: {rental}")
+        self._log("Rental created: %s", rental)
         return rental
 
     def return_car(self, rental_id: str) -> bool:
         """Process a car return."""
-        for rental in self.rentals:
-            if rental.rental_id == rental_id and not rental.returned:
-                rental.returned = True
-                rental.car.available = True
-                print(f"Car returned: {rental}")
-                return True
-
-        print(f"Rental {rental_id} not found or already returned")
-        return False
+        rental = self._rentals_by_id.get(rental_id)
+        if rental is None or rental.returned:
+            self._log("Rental %s not found or already returned", rental_id)
+            return False
+
+        rental.returned = True
+        self._set_available(rental.car, True)
+        del self._active_rentals[rental_id]
+        self._completed_count += 1
+        self._total_revenue_cents += rental.total_cost_cents
+        self._log("Car returned: %s", rental)
+        return True
 
     def get_rental_summary(self) -> Dict:
         """Get rental system summary."""
-        active_rentals = [r for r in self.rentals if not r.returned]
-        total_revenue = sum(r.total_cost for r in self.rentals if r.returned)
-
         return {
             "total_cars": len(self.cars),
-            "available_cars": len(self.get_available_cars()),
+            "available_cars": len(self._available),
             "total_customers": len(self.customers),
-            "active_rentals": len(active_rentals),
-            "completed_rentals": len([r for r in self.rentals if r.returned]),
-            "total_revenue": total_revenue,
+            "active_rentals": len(self._active_rentals),
+            "completed_rentals": self._completed_count,
+            "total_revenue": self._total_revenue_cents / 100,
         }
 
     def load_sample_data(self):
@@ -177,8 +342,7 @@ class CarRentalSystem:
             Car("C005", "Nissan", "Altima", 2021, 42.00),
         ]
 
-        for car in sample_cars:
-            self.add_car(car)
+        self.add_cars(sample_cars)
 
         # Sample customers
         sample_customers = [
@@ -188,12 +352,12 @@ class CarRentalSystem:
             Customer("CUST004", "Alice Brown", "alice.brown@email.com", "555-0104"),
         ]
 
-        for customer in sample_customers:
-            self.add_customer(customer)
+        self.add_customers(sample_customers)
 
 
 def main():
     """Main function to demonstrate the car rental system."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     print("=== Car Rental System Demo ===")
 
     # Initialize system
@@ -2,11 +2,25 @@
 Basic tests for the car rental system.
 """
 
+import json
+import os
+import tempfile
 import unittest
 from datetime import datetime
 
 from car_rental import Car, CarRentalSystem, Customer, Rental
-from utils import validate_car_data, validate_customer_data
+from utils import (
+    generate_report,
+    load_all_cars,
+    load_cars_from_json,
+    load_cars_from_jsonl,
+    load_customers_from_csv,
+    save_cars_to_json,
+    save_cars_to_jsonl,
+    save_customers_to_csv,
+    validate_car_data,
+    validate_customer_data,
+)
 
 
 class TestCarRentalSystem(unittest.TestCase):
@@ -47,6 +61,52 @@ class TestCarRentalSystem(unittest.TestCase):
         self.assertEqual(len(self.rental_system.customers), 1)
         self.assertEqual(self.rental_system.customers[0], self.customer)
 
+    def test_add_cars_and_customers_in_bulk(self):
+        """Test bulk adds populate the lookup indexes."""
+        car2 = Car("C002", "Honda", "Civic", 2021, 40.00, False)
+        self.rental_system.add_cars(iter([self.car, car2]))
+        self.rental_system.add_customers([self.customer])
+
+        self.assertEqual(self.rental_system.cars, [self.car, car2])
+        self.assertEqual(self.rental_system.find_car("C002"), car2)
+        self.assertEqual(self.rental_system.get_available_cars(), [self.car])
+        self.assertEqual(self.rental_system.find_customer("CUST001"), self.customer)
+
+    def test_numeric_ids(self):
+        """Test cars and customers with non-string IDs."""
+        car = Car(1, "Toyota", "Camry", 2022, 45.00)
+        customer = Customer(7, "John Smith", "john.smith@email.com", "555-0101")
+        self.rental_system.add_car(car)
+        self.rental_system.add_customer(customer)
+
+        self.assertIs(self.rental_system.find_car(1), car)
+        self.assertIsNotNone(self.rental_system.rent_car(7, 1, 2))
+
+    def test_add_duplicate_ids(self):
+        """Test duplicate car and customer IDs are rejected."""
+        self.rental_system.add_car(self.car)
+        self.rental_system.add_customer(self.customer)
+
+        with self.assertRaises(ValueError):
+            self.rental_system.add_car(Car("C001", "Honda", "Civic", 2021, 40.00))
+        with self.assertRaises(ValueError):
+            self.rental_system.add_cars(
+                [
+                    Car("C002", "Honda", "Civic", 2021, 40.00),
+                    Car("C002", "Ford", "Mustang", 2023, 75.00),
+                ]
+            )
+        with self.assertRaises(ValueError):
+            self.rental_system.add_customer(
+                Customer("CUST001", "Jane Doe", "jane.doe@email.com", "555-0102")
+            )
+
+        summary = self.rental_system.get_rental_summary()
+        self.assertEqual(summary["total_cars"], 1)
+        self.assertEqual(summary["available_cars"], 1)
+        self.assertEqual(self.rental_system.find_car("C001"), self.car)
+        self.assertIsNone(self.rental_system.find_car("C002"))
+
     def test_find_car(self):
         """Test finding a car by ID."""
         self.rental_system.add_car(self.car)
@@ -77,6 +137,56 @@ class TestCarRentalSystem(unittest.TestCase):
         self.assertEqual(len(available), 1)
         self.assertEqual(available[0], car1)
 
+    def test_available_cars_after_rental(self):
+        """Test available cars track rentals and returns."""
+        self.rental_system.add_car(self.car)
+        self.rental_system.add_customer(self.customer)
+
+        rental = self.rental_system.rent_car("CUST001", "C001", 3)
+        self.assertEqual(self.rental_system.get_available_cars(), [])
+
+        self.rental_system.return_car(rental.rental_id)
+        self.assertEqual(self.rental_system.get_available_cars(), [self.car])
+
+    def test_available_cars_keep_fleet_order(self):
+        """Test a returned car goes back to its fleet position."""
+        self.rental_system.load_sample_data()
+        rental = self.rental_system.rent_car("CUST001", "C001", 3)
+        self.rental_system.rent_car("CUST002", "C003", 2)
+        self.rental_system.return_car(rental.rental_id)
+
+        available = self.rental_system.get_available_cars()
+        self.assertEqual(
+            [car.car_id for car in available], ["C001", "C002", "C004", "C005"]
+        )
+
+    def test_find_available(self):
+        """Test searching available cars by make and model."""
+        self.rental_system.load_sample_data()
+        self.rental_system.add_car(Car("C006", "Toyota", "Corolla", 2023, 38.00))
+        self.rental_system.rent_car("CUST001", "C001", 3)
+
+        toyotas = self.rental_system.find_available(make="Toyota")
+        self.assertEqual([car.car_id for car in toyotas], ["C006"])
+
+        civics = self.rental_system.find_available(make="Honda", model="Civic")
+        self.assertEqual([car.car_id for car in civics], ["C002"])
+
+        self.assertEqual(self.rental_system.find_available(model="Camry"), [])
+        self.assertEqual(self.rental_system.find_available(make="Tesla"), [])
+        self.assertEqual(len(self.rental_system.find_available()), 5)
+
+    def test_find_available_keeps_fleet_order(self):
+        """Test several matches come back in fleet order."""
+        self.rental_system.add_cars(
+            Car(f"C{i:03d}", "Toyota", "Camry", 2022, 45.00) for i in range(8, 0, -1)
+        )
+
+        camrys = self.rental_system.find_available(make="Toyota", model="Camry")
+        self.assertEqual(
+            [car.car_id for car in camrys], [f"C{i:03d}" for i in range(8, 0, -1)]
+        )
+
     def test_rent_car(self):
         """Test car rental process."""
         self.rental_system.add_car(self.car)
@@ -91,6 +201,20 @@ class TestCarRentalSystem(unittest.TestCase):
         self.assertFalse(self.car.available)
         self.assertEqual(len(self.rental_system.rentals), 1)
 
+    def test_rent_car_with_start_date(self):
+        """Test renting with an explicit start date."""
+        self.rental_system.add_car(self.car)
+        self.rental_system.add_customer(self.customer)
+
+        start = datetime(2024, 3, 1, 9, 0)
+        rental = self.rental_system.rent_car("CUST001", "C001", 3, start_date=start)
+
+        self.assertEqual(rental.start_date, start)
+        self.assertEqual(rental.end_date, datetime(2024, 3, 4, 9, 0))
+
+        rental.end_date = datetime(2024, 3, 5, 12, 0)
+        self.assertEqual(rental.end_date, datetime(2024, 3, 5, 12, 0))
+
     def test_return_car(self):
         """Test car return process."""
         self.rental_system.add_car(self.car)
@@ -106,6 +230,25 @@ class TestCarRentalSystem(unittest.TestCase):
         self.assertTrue(rental.returned)
         self.assertTrue(self.car.available)
 
+    def test_rental_ids_are_sequential(self):
+        """Test rental IDs come from a monotonic counter."""
+        self.rental_system.load_sample_data()
+        first = self.rental_system.rent_car("CUST001", "C001", 3)
+        second = self.rental_system.rent_car("CUST002", "C002", 2)
+
+        self.assertEqual(first.rental_id, "R0001")
+        self.assertEqual(second.rental_id, "R0002")
+
+    def test_return_car_unknown_or_returned(self):
+        """Test returning an unknown or already returned rental."""
+        self.rental_system.add_car(self.car)
+        self.rental_system.add_customer(self.customer)
+
+        rental = self.rental_system.rent_car("CUST001", "C001", 3)
+        self.assertFalse(self.rental_system.return_car("R9999"))
+        self.assertTrue(self.rental_system.return_car(rental.rental_id))
+        self.assertFalse(self.rental_system.return_car(rental.rental_id))
+
     def test_rental_summary(self):
         """Test rental system summary."""
         self.rental_system.load_sample_data()
@@ -118,6 +261,50 @@ class TestCarRentalSystem(unittest.TestCase):
         self.assertIn("completed_rentals", summary)
         self.assertIn("total_revenue", summary)
 
+    def test_rental_summary_counts(self):
+        """Test summary counters follow rentals and returns."""
+        self.rental_system.load_sample_data()
+        rental = self.rental_system.rent_car("CUST001", "C001", 3)
+        self.rental_system.rent_car("CUST002", "C002", 2)
+        self.rental_system.return_car(rental.rental_id)
+
+        summary = self.rental_system.get_rental_summary()
+        self.assertEqual(summary["available_cars"], 4)
+        self.assertEqual(summary["active_rentals"], 1)
+        self.assertEqual(summary["completed_rentals"], 1)
+        self.assertEqual(summary["total_revenue"], 135.00)
+        self.assertEqual(
+            [r.rental_id for r in self.rental_system.get_active_rentals()], ["R0002"]
+        )
+
+    def test_rental_cost_in_cents(self):
+        """Test rental cost is exact for rates that are not binary fractions."""
+        car = Car("C010", "Kia", "Rio", 2020, 19.99)
+        rental = Rental("R0001", self.customer, car, datetime(2024, 1, 1), 3)
+
+        self.assertEqual(car.daily_rate_cents, 1999)
+        self.assertEqual(rental.total_cost_cents, 5997)
+        self.assertEqual(rental.total_cost, 59.97)
+
+    def test_daily_rate_rounding(self):
+        """Test rates round half up on their decimal value."""
+        self.assertEqual(Car("C010", "Kia", "Rio", 2020, 0.285).daily_rate_cents, 29)
+        self.assertEqual(Car("C010", "Kia", "Rio", 2020, 45.555).daily_rate_cents, 4556)
+
+    def test_integer_daily_rate(self):
+        """Test integer rates keep their type and formatting."""
+        car = Car("C010", "Kia", "Rio", 2020, 45)
+
+        self.assertEqual(car.daily_rate_cents, 4500)
+        self.assertIsInstance(car.daily_rate, int)
+        self.assertEqual(str(car), "2020 Kia Rio (ID: C010) - $45/day - Available")
+
+        car.daily_rate_cents = 4599
+        self.assertEqual(car.daily_rate, 45.99)
+        self.assertEqual(
+            str(self.car), "2022 Toyota Camry (ID: C001) - $45.0/day - Available"
+        )
+
 
 class TestValidation(unittest.TestCase):
 
@@ -156,6 +343,179 @@ class TestValidation(unittest.TestCase):
         invalid_email["email"] = "invalid-email"
         self.assertFalse(validate_customer_data(invalid_email))
 
+        invalid_email["email"] = "john.smith@localhost"
+        self.assertFalse(validate_customer_data(invalid_email))
+
+        # Phone numbers
+        international = valid_customer.copy()
+        international["phone"] = "+1 (555) 010-1234"
+        self.assertTrue(validate_customer_data(international))
+
+        invalid_phone = valid_customer.copy()
+        invalid_phone["phone"] = "call me"
+        self.assertFalse(validate_customer_data(invalid_phone))
+
+        invalid_phone["phone"] = "555-01"
+        self.assertFalse(validate_customer_data(invalid_phone))
+
+
+class TestReport(unittest.TestCase):
+
+    def test_generate_report(self):
+        """Test the report lists summary, available cars and active rentals."""
+        rental_system = CarRentalSystem(verbose=False)
+        rental_system.load_sample_data()
+        rental_system.rent_car("CUST002", "C002", 2)
+
+        lines = generate_report(rental_system).split("\n")
+
+        self.assertEqual(lines[0], "=== CAR RENTAL SYSTEM REPORT ===")
+        self.assertIn("  Cars Currently Rented: 1", lines)
+        self.assertIn("  Total Revenue: $0.00", lines)
+        active = lines[lines.index("ACTIVE RENTALS:") + 1 :]
+        self.assertEqual(
+            active, ["  Rental R0001: Jane Doe renting Honda Civic for 2 days ($80.00)"]
+        )
+
+    def test_generate_report_empty(self):
+        """Test the report placeholders for an empty system."""
+        report = generate_report(CarRentalSystem(verbose=False))
+
+        self.assertIn("  No cars currently available", report)
+        self.assertTrue(report.endswith("ACTIVE RENTALS:\n  No active rentals"))
+
+
+class TestPersistence(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a temporary directory for data files."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def path(self, name):
+        return os.path.join(self.tmpdir.name, name)
+
+    def test_cars_json_round_trip(self):
+        """Test saving and loading cars as JSON."""
+        cars = [
+            Car("C001", "Toyota", "Camry", 2022, 45.00),
+            Car("C002", "Honda", "Civic", 2021, 40.00, False),
+        ]
+        save_cars_to_json(cars, self.path("cars.json"))
+        loaded = load_cars_from_json(self.path("cars.json"))
+
+        self.assertEqual([str(car) for car in loaded], [str(car) for car in cars])
+
+    def test_load_all_cars(self):
+        """Test loading cars from several files keeps file order."""
+        save_cars_to_json(
+            [Car("C001", "Toyota", "Camry", 2022, 45.00)], self.path("a.json")
+        )
+        save_cars_to_json(
+            [Car("C002", "Honda", "Civic", 2021, 40.00)], self.path("b.json")
+        )
+
+        cars = load_all_cars([self.path("a.json"), self.path("b.json")])
+        self.assertEqual([car.car_id for car in cars], ["C001", "C002"])
+
+        cars = load_all_cars([self.path("b.json")])
+        self.assertEqual([car.car_id for car in cars], ["C002"])
+
+    def test_load_cars_from_legacy_json(self):
+        """Test loading the older list-of-objects JSON layout."""
+        with open(self.path("cars.json"), "w") as f:
+            json.dump(
+                [
+                    {
+                        "car_id": "C001",
+                        "make": "Toyota",
+                        "model": "Camry",
+                        "year": 2022,
+                        "daily_rate": 45.0,
+                        "available": False,
+                    }
+                ],
+                f,
+            )
+
+        cars = load_cars_from_json(self.path("cars.json"))
+        self.assertEqual(
+            [str(car) for car in cars],
+            ["2022 Toyota Camry (ID: C001) - $45.0/day - Rented"],
+        )
+
+    def test_cars_jsonl_round_trip(self):
+        """Test streaming cars through a JSON Lines file."""
+        cars = [
+            Car("C001", "Toyota", "Camry", 2022, 45.00),
+            Car("C002", "Honda", "Civic", 2021, 40.00, False),
+        ]
+        save_cars_to_jsonl(cars, self.path("cars.jsonl"))
+        loaded = list(load_cars_from_jsonl(self.path("cars.jsonl")))
+
+        self.assertEqual([str(car) for car in loaded], [str(car) for car in cars])
+
+    def test_load_cars_from_jsonl_ignores_extra_keys(self):
+        """Test JSON Lines records may carry keys Car does not use."""
+        record = {
+            "car_id": "C001",
+            "make": "Toyota",
+            "model": "Camry",
+            "year": 2022,
+            "daily_rate": 45.0,
+            "available": True,
+            "location_id": "LOC001",
+        }
+        with open(self.path("cars.jsonl"), "w") as f:
+            f.write(json.dumps(record) + "\n")
+
+        cars = list(load_cars_from_jsonl(self.path("cars.jsonl")))
+        self.assertEqual([car.car_id for car in cars], ["C001"])
+
+    def test_customers_csv_round_trip(self):
+        """Test saving and loading customers as CSV."""
+        customers = [
+            Customer("CUST001", "John Smith", "john.smith@email.com", "555-0101"),
+            Customer("CUST002", "Doe, Jane", "jane.doe@email.com", "555-0102"),
+        ]
+        save_customers_to_csv(customers, self.path("customers.csv"))
+        loaded = load_customers_from_csv(self.path("customers.csv"))
+
+        self.assertEqual(
+            [(c.customer_id, c.name, c.email, c.phone) for c in loaded],
+            [(c.customer_id, c.name, c.email, c.phone) for c in customers],
+        )
+
+    def test_load_customers_with_extra_columns(self):
+        """Test loading the sample customers file, which has extra columns."""
+        filename = os.path.join(os.path.dirname(__file__), "data", "customers.csv")
+        customers = load_customers_from_csv(filename)
+
+        self.assertEqual(len(customers), 10)
+        self.assertEqual(customers[0].customer_id, "CUST001")
+        self.assertEqual(customers[0].phone, "555-0101")
+
+    def test_load_customers_skips_blank_and_pads_short_rows(self):
+        """Test blank lines are skipped and short rows padded with None."""
+        with open(self.path("customers.csv"), "w", newline="") as f:
+            f.write(
+                "customer_id,name,email,phone\n"
+                "CUST001,A,a@b.c,555-0101\n"
+                "\n"
+                "CUST002,B,b@c.d\n"
+                "\n"
+            )
+
+        customers = load_customers_from_csv(self.path("customers.csv"))
+
+        self.assertEqual([c.customer_id for c in customers], ["CUST001", "CUST002"])
+        self.assertIsNone(customers[1].phone)
+
+    def test_load_missing_file(self):
+        """Test loading a missing file returns an empty list."""
+        with self.assertLogs("utils", level="WARNING"):
+            self.assertEqual(load_cars_from_json(self.path("missing.json")), [])
+
 
 if __name__ == "__main__":
     unittest.main()  # type: ignore[no-untyped-call]
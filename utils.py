@@ -4,117 +4,179 @@ Utility functions for the car rental system.
 
 import csv
 import json
-from typing import Dict, List
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from operator import attrgetter, itemgetter
+from typing import Dict, Iterable, Iterator, List
 
 from car_rental import Car, CarRentalSystem, Customer
 
+logger = logging.getLogger(__name__)
+
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+# 7-15 digits (E.164 allows at most 15), optionally separated by spaces,
+# dots, dashes or parentheses, with an optional leading "+".
+_PHONE_RE = re.compile(r"\+?(?:[\s().-]*\d){7,15}[\s().-]*")
+
+_IO_BUFFER_SIZE = 64 * 1024
+
+_CAR_FIELDS = ("car_id", "make", "model", "year", "daily_rate", "available")
+_car_values = attrgetter(*_CAR_FIELDS)
+_car_record_values = itemgetter(*_CAR_FIELDS)
+
+_CUSTOMER_FIELDS = ("customer_id", "name", "email", "phone")
+_customer_values = attrgetter(*_CUSTOMER_FIELDS)
+
+# Summary entries used by generate_report; available cars are counted
+# from the listing itself.
+_SUMMARY_KEYS = (
+    "total_cars",
+    "total_customers",
+    "active_rentals",
+    "completed_rentals",
+    "total_revenue",
+)
+_summary_values = itemgetter(*_SUMMARY_KEYS)
+
+_CAR_REQUIRED_FIELDS = frozenset(("car_id", "make", "model", "year", "daily_rate"))
+
 
 def save_cars_to_json(cars: List[Car], filename: str) -> None:
-    """Save cars data to JSON file."""
-    cars_data = []
-    for car in cars:
-        cars_data.append(
-            {
-                "car_id": car.car_id,
-                "make": car.make,
-                "model": car.model,
-                "year": car.year,
-                "daily_rate": car.daily_rate,
-                "available": car.available,
-            }
-        )
-
-    with open(filename, "w") as f:
-        json.dump(cars_data, f, indent=2)
+    """Save cars data to JSON file as a field list plus one row per car."""
+    cars_data = {
+        "fields": _CAR_FIELDS,
+        "rows": [_car_values(car) for car in cars],
+    }
+
+    # Encode in one call and write once; json.dump would issue a write per chunk.
+    with open(filename, "w", buffering=_IO_BUFFER_SIZE) as f:
+        f.write(json.dumps(cars_data))
 
 
 def load_cars_from_json(filename: str) -> List[Car]:
     """Load cars data from JSON file."""
     cars = []
     try:
-        with open(filename, "r") as f:
+        with open(filename, "r", buffering=_IO_BUFFER_SIZE) as f:
             cars_data = json.load(f)
 
-        for car_data in cars_data:
-            car = Car(
-                car_data["car_id"],
-                car_data["make"],
-                car_data["model"],
-                car_data["year"],
-                car_data["daily_rate"],
-                car_data["available"],
-            )
-            cars.append(car)
+        if isinstance(cars_data, dict):
+            # Resolve column positions once, as for CSV headers.
+            fields = cars_data["fields"]
+            values = itemgetter(*(fields.index(name) for name in _CAR_FIELDS))
+            cars = [Car(*values(row)) for row in cars_data["rows"]]
+        else:
+            # Older files hold a list of per-car objects.
+            cars = [Car(*_car_record_values(car_data)) for car_data in cars_data]
     except FileNotFoundError:
-        print(f"File {filename} not found")
+        logger.warning("File %s not found", filename)
 
     return cars
 
 
+def load_all_cars(filenames: List[str]) -> List[Car]:
+    """Load cars from several JSON files, reading them concurrently."""
+    if len(filenames) < 2:
+        # Not worth starting a thread pool for a single file.
+        results = [load_cars_from_json(filename) for filename in filenames]
+    else:
+        with ThreadPoolExecutor() as executor:
+            results = list(executor.map(load_cars_from_json, filenames))
+
+    return list(chain.from_iterable(results))
+
+
+def save_cars_to_jsonl(cars: Iterable[Car], filename: str) -> None:
+    """Save cars data to a JSON Lines file, one car per line."""
+    with open(filename, "w", buffering=_IO_BUFFER_SIZE) as f:
+        for car in cars:
+            f.write(json.dumps(dict(zip(_CAR_FIELDS, _car_values(car)))))
+            f.write("\n")
+
+
+def load_cars_from_jsonl(filename: str) -> Iterator[Car]:
+    """Stream cars from a JSON Lines file without loading it all at once."""
+    try:
+        with open(filename, "r", buffering=_IO_BUFFER_SIZE) as f:
+            for line in f:
+                if line.strip():
+                    yield Car(*_car_record_values(json.loads(line)))
+    except FileNotFoundError:
+        logger.warning("File %s not found", filename)
+
+
 def save_customers_to_csv(customers: List[Customer], filename: str) -> None:
     """Save customers data to CSV file."""
-    with open(filename, "w", newline="") as f:
+    with open(
+        filename, "w", newline="", encoding="utf-8", buffering=_IO_BUFFER_SIZE
+    ) as f:
         writer = csv.writer(f)
-        writer.writerow(["customer_id", "name", "email", "phone"])
-
-        for customer in customers:
-            writer.writerow(
-                [customer.customer_id, customer.name, customer.email, customer.phone]
-            )
+        writer.writerow(_CUSTOMER_FIELDS)
+        writer.writerows(map(_customer_values, customers))
 
 
 def load_customers_from_csv(filename: str) -> List[Customer]:
     """Load customers data from CSV file."""
     customers = []
     try:
-        with open(filename, "r") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                customer = Customer(
-                    row["customer_id"], row["name"], row["email"], row["phone"]
-                )
-                customers.append(customer)
+        with open(
+            filename, "r", newline="", encoding="utf-8", buffering=_IO_BUFFER_SIZE
+        ) as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is not None:
+                # Resolve column positions once; files may carry extra columns.
+                columns = [header.index(name) for name in _CUSTOMER_FIELDS]
+                fields = itemgetter(*columns)
+                width = max(columns) + 1
+                for row in reader:
+                    if not row:
+                        continue
+                    if len(row) < width:
+                        # Pad short rows with None, as csv.DictReader does.
+                        row += [None] * (width - len(row))
+                    customers.append(Customer(*fields(row)))
     except FileNotFoundError:
-        print(f"File {filename} not found")
+        logger.warning("File %s not found", filename)
 
     return customers
 
 
 def generate_report(rental_system: CarRentalSystem) -> str:
     """Generate a comprehensive rental report."""
-    summary = rental_system.get_rental_summary()
-
-    report = ["=== CAR RENTAL SYSTEM REPORT ===\n"]
-
-    # Summary statistics
-    report.append("SUMMARY STATISTICS:")
-    report.append(f"  Total Cars in Fleet: {summary['total_cars']}")
-    report.append(f"  Available Cars: {summary['available_cars']}")
-    report.append(
-        f"  Cars Currently Rented: {summary['total_cars'] - summary['available_cars']}"
+    total_cars, total_customers, active_count, completed_count, revenue = (
+        _summary_values(rental_system.get_rental_summary())
     )
-    report.append(f"  Total Customers: {summary['total_customers']}")
-    report.append(f"  Active Rentals: {summary['active_rentals']}")
-    report.append(f"  Completed Rentals: {summary['completed_rentals']}")
-    report.append(f"  Total Revenue: ${summary['total_revenue']:.2f}\n")
-
-    # Available cars
-    report.append("AVAILABLE CARS:")
     available_cars = rental_system.get_available_cars()
+    available_count = len(available_cars)
+
+    report = [
+        "=== CAR RENTAL SYSTEM REPORT ===",
+        "",
+        "SUMMARY STATISTICS:",
+        f"  Total Cars in Fleet: {total_cars}",
+        f"  Available Cars: {available_count}",
+        f"  Cars Currently Rented: {total_cars - available_count}",
+        f"  Total Customers: {total_customers}",
+        f"  Active Rentals: {active_count}",
+        f"  Completed Rentals: {completed_count}",
+        f"  Total Revenue: ${revenue:.2f}",
+        "",
+        "AVAILABLE CARS:",
+    ]
+
     if available_cars:
-        for car in available_cars:
-            report.append(f"  {car}")
+        report.extend(f"  {car}" for car in available_cars)
     else:
         report.append("  No cars currently available")
 
-    report.append("")
+    report += ["", "ACTIVE RENTALS:"]
 
-    # Active rentals
-    report.append("ACTIVE RENTALS:")
-    active_rentals = [r for r in rental_system.rentals if not r.returned]
+    active_rentals = rental_system.get_active_rentals()
     if active_rentals:
-        for rental in active_rentals:
-            report.append(f"  {rental}")
+        report.extend(f"  {rental}" for rental in active_rentals)
     else:
         report.append("  No active rentals")
 
@@ -123,11 +185,8 @@ def generate_report(rental_system: CarRentalSystem) -> str:
 
 def validate_car_data(car_data: Dict) -> bool:
     """Validate car data format."""
-    required_fields = ["car_id", "make", "model", "year", "daily_rate"]
-
-    for field in required_fields:
-        if field not in car_data:
-            return False
+    if not car_data.keys() >= _CAR_REQUIRED_FIELDS:
+        return False
 
     if not isinstance(car_data["year"], int) or car_data["year"] < 1900:
         return False
@@ -143,16 +202,17 @@ def validate_car_data(car_data: Dict) -> bool:
 
 def validate_customer_data(customer_data: Dict) -> bool:
     """Validate customer data format."""
-    required_fields = ["customer_id", "name", "email", "phone"]
-
-    for field in required_fields:
+    for field in _CUSTOMER_FIELDS:
         if field not in customer_data:
             return False
         if not customer_data[field] or not isinstance(customer_data[field], str):
             return False
 
     # Basic email validation
-    if "@" not in customer_data["email"] or "." not in customer_data["email"]:
+    if _EMAIL_RE.fullmatch(customer_data["email"]) is None:
+        return False
+
+    if _PHONE_RE.fullmatch(customer_data["phone"]) is None:
         return False
 
     return True